@@ -18,6 +18,41 @@ def autocorrelation(x):
     return result[int(result.size / 2):]
 
 
+def _autocorrelations(x):
+    """
+    Calculates the autocorrelation of every column in an array ``x`` of shape
+    ``(n, ...)``, along the first axis.
+
+    This gives the same result as applying :meth:`autocorrelation()` to each
+    column, but uses a single (batched) fast Fourier transform.
+    """
+    n = x.shape[0]
+    x = (x - np.mean(x, axis=0)) / (np.std(x, axis=0) * np.sqrt(n))
+
+    # Zero-pad to a power of 2, to avoid circular correlation
+    n_fft = 2**int(np.ceil(np.log2(2 * n - 1)))
+    f = np.fft.rfft(x, n=n_fft, axis=0)
+    return np.fft.irfft(f * np.conj(f), n=n_fft, axis=0)[:n]
+
+
+def _effective_sample_sizes(x):
+    """
+    Calculates the effective sample size of every column in an array ``x`` of
+    shape ``(n, ...)``, along the first axis.
+
+    This gives the same result as applying
+    :meth:`effective_sample_size_single_parameter()` to each column in turn.
+    """
+    rho = _autocorrelations(x)
+    n = rho.shape[0]
+
+    # Sum autocorrelations up to the first negative entry in each column
+    negative = rho < 0
+    T = np.where(np.any(negative, axis=0), np.argmax(negative, axis=0), n)
+    lags = np.arange(n).reshape((n, ) + (1, ) * (rho.ndim - 1))
+    return n / (1 + 2 * np.sum(np.where(lags < T, rho, 0), axis=0))
+
+
 def _autocorrelate_negative(autocorrelation):
     """
     Returns the index of the first negative entry in ``autocorrelation``, or
@@ -61,8 +96,7 @@ def effective_sample_size(samples):
     if n_samples < 2:
         raise ValueError('At least two samples must be given.')
 
-    return [effective_sample_size_single_parameter(samples[:, i])
-            for i in range(0, n_params)]
+    return list(_effective_sample_sizes(samples))
 
 
 def _within(chains):
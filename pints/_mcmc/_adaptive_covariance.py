@@ -57,8 +57,9 @@ class AdaptiveCovarianceMC(pints.SingleChainMCMC):
 
         # Parameters used in setting the proposal distributions
         # See update_mu() and update_sigma()
-        self._mu = np.array(self._x0, copy=True)
-        self._sigma = np.array(self._sigma0, copy=True)
+        # Note: both are updated in place during adaptation
+        self._mu = np.array(self._x0, dtype=float, copy=True)
+        self._sigma = np.array(self._sigma0, dtype=float, copy=True)
 
         # Determines decay rate in adaptation
         self._eta = 0.6
@@ -90,7 +91,8 @@ class AdaptiveCovarianceMC(pints.SingleChainMCMC):
         Called at the end of every ``tell()`` to adapt the current running mean
         used to calculate the sample covariance matrix of proposals.
         """
-        self._mu = (1 - self._gamma) * self._mu + self._gamma * self._current
+        self._mu *= 1 - self._gamma
+        self._mu += self._gamma * self._current
 
     def _adapt_sigma(self, log_ratio):
         """
@@ -102,9 +104,9 @@ class AdaptiveCovarianceMC(pints.SingleChainMCMC):
         log_ratio
             The log of the ratio proposed log pdf / current log pdf.
         """
-        dsigm = np.reshape(self._current - self._mu, (self._n_parameters, 1))
-        self._sigma = ((1 - self._gamma) * self._sigma +
-                       self._gamma * np.dot(dsigm, dsigm.T))
+        dsigm = self._current - self._mu
+        self._sigma *= 1 - self._gamma
+        self._sigma += self._gamma * np.outer(dsigm, dsigm)
 
     def ask(self):
         """ See :meth:`SingleChainMCMC.ask()`. """
@@ -193,6 +195,13 @@ class AdaptiveCovarianceMC(pints.SingleChainMCMC):
         self._current_log_pdf = current_log_pdf
         self._proposed = proposed
 
+    def _sample_log_u(self):
+        """
+        Returns the log of a sample from ``uniform(0, 1)``, for use in the
+        accept/reject step in :meth:`tell()`.
+        """
+        return np.log(np.random.uniform(0, 1))
+
     def set_eta(self, eta):
         """
         Updates ``eta`` which controls the rate of adaptation decay
@@ -268,7 +277,7 @@ class AdaptiveCovarianceMC(pints.SingleChainMCMC):
         # Accept or reject the point
         accepted = False
         if np.isfinite(fx):
-            u = np.log(np.random.uniform(0, 1))
+            u = self._sample_log_u()
             if u < log_ratio:
                 accepted = True
                 self._acceptance_count += 1
@@ -60,17 +60,73 @@ class HaarioACMC(pints.AdaptiveCovarianceMC):
         super(HaarioACMC, self).__init__(x0, sigma0)
         self._log_lambda = 0
 
+        # Scaling applied to proposals, sqrt(lambda), updated along with
+        # log lambda so that it isn't recalculated for every proposal
+        self._proposal_scale = 1
+
+        # Cached Cholesky factor of sigma, recalculated when sigma is adapted
+        self._sigma_chol = None
+
+        # Pools of standard normal and log uniform draws, refilled in blocks to
+        # avoid calling the random number generator on every iteration
+        self._pool_size = 256
+        self._z_pool = None
+        self._z_index = 0
+        self._log_u_pool = None
+        self._log_u_index = 0
+
     def _adapt_internal(self, accepted, log_ratio):
         """ See :meth:`pints.AdaptiveCovarianceMC._adapt()`. """
         p = np.exp(log_ratio) if log_ratio < 0 else 1
         self._log_lambda += self._gamma * (p - self._target_acceptance)
+        self._proposal_scale = np.exp(0.5 * self._log_lambda)
+
+    def _adapt_sigma(self, log_ratio):
+        """ See :meth:`pints.AdaptiveCovarianceMC._adapt_sigma()`. """
+        super(HaarioACMC, self)._adapt_sigma(log_ratio)
+        self._sigma_chol = None
 
     def _generate_proposal(self):
         """ See :meth:`AdaptiveCovarianceMC._generate_proposal()`. """
-        return np.random.multivariate_normal(
-            self._current, self._sigma * np.exp(self._log_lambda))
+        # Sample using a cached Cholesky factor ``L`` of sigma, so that
+        # ``current + sqrt(lambda) * L z`` with ``z ~ N(0, I)`` is distributed
+        # as ``N(current, lambda * sigma)``.
+        if self._sigma_chol is None:
+            try:
+                self._sigma_chol = np.linalg.cholesky(self._sigma)
+            except np.linalg.LinAlgError:
+                # Sigma is only positive semi-definite (e.g. because it was
+                # set that way, or through rounding during adaptation), so use
+                # an eigendecomposition ``V diag(w) V^T`` instead, with factor
+                # ``V sqrt(w)``
+                w, v = np.linalg.eigh(self._sigma)
+                self._sigma_chol = v * np.sqrt(np.maximum(w, 0))
+
+        # Take the next standard normal vector from the pool
+        if self._z_pool is None or self._z_index == self._pool_size:
+            self._z_pool = np.random.standard_normal(
+                (self._pool_size, self._n_parameters))
+            self._z_index = 0
+        z = self._z_pool[self._z_index]
+        self._z_index += 1
+
+        # The returned array is handed out as read-only, and may become the
+        # current point, so it can't be reused: instead, the arithmetic is
+        # done in place on the one array that must be created anyway.
+        proposed = np.dot(self._sigma_chol, z)
+        proposed *= self._proposal_scale
+        proposed += self._current
+        return proposed
 
     def name(self):
         """ See :meth:`pints.MCMCSampler.name()`. """
         return 'Haario adaptive covariance MCMC'
 
+    def _sample_log_u(self):
+        """ See :meth:`AdaptiveCovarianceMC._sample_log_u()`. """
+        if self._log_u_pool is None or self._log_u_index == self._pool_size:
+            self._log_u_pool = np.log(np.random.uniform(0, 1, self._pool_size))
+            self._log_u_index = 0
+        u = self._log_u_pool[self._log_u_index]
+        self._log_u_index += 1
+        return u
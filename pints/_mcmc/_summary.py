@@ -139,7 +139,10 @@ class MCMCSummary(object):
         """
         Calculates posterior summaries for all parameters.
         """
-        stacked = np.vstack(self._chains)
+        # Stack the chains into a single 2d array. For the usual case of a 3d
+        # array this is a view, so no copy of the samples is made.
+        chains = np.asarray(self._chains)
+        stacked = chains.reshape(-1, chains.shape[-1])
 
         # Mean, std and quantiles
         self._mean = np.mean(stacked, axis=0)
@@ -150,10 +153,14 @@ class MCMCSummary(object):
         # Rhat
         self._rhat = pints.rhat(self._chains)
 
-        # Effective sample size
-        self._ess = np.zeros(self._n_parameters)
-        for i, chain in enumerate(self._chains):
-            self._ess += pints.effective_sample_size(chain)
+        # Effective sample size, summed over all chains. This is calculated
+        # for all chains and parameters at once, by passing in a 2d array with
+        # a column for every (chain, parameter) pair.
+        n_chains, n_samples, n_parameters = chains.shape
+        ess = pints.effective_sample_size(
+            chains.swapaxes(0, 1).reshape(n_samples, -1))
+        self._ess = np.sum(
+            np.reshape(ess, (n_chains, n_parameters)), axis=0)
 
         if self._time is not None:
             self._ess_per_second = np.array(self._ess) / self._time
@@ -5,6 +5,8 @@
 # released under the BSD 3-clause license. See accompanying LICENSE.md for
 # copyright notice and full license details.
 #
+import collections
+import functools
 import io
 import os
 import shutil
@@ -14,6 +16,7 @@ import tempfile
 import numpy as np
 
 import pints
+import pints.toy
 
 
 class StreamCapture(object):
@@ -395,3 +398,41 @@ class SwappingTransformation(pints.Transformation):
 
     def to_search(self, p):
         return p[::-1]
+
+
+LogisticPosterior = collections.namedtuple('LogisticPosterior', [
+    'problem', 'log_prior', 'log_likelihood', 'log_posterior',
+    'real_parameters'])
+
+
+@functools.lru_cache(maxsize=None)
+def logistic_posterior(seed=1):
+    """
+    Returns a :class:`LogisticPosterior` tuple with a noisy logistic model
+    problem, a uniform prior, a Gaussian log-likelihood (with unknown noise),
+    the resulting log-posterior, and the true parameters.
+
+    Results are cached, so that test modules sharing this problem only create
+    it once per process: the returned objects should not be modified. The
+    noise is generated with a local random state, so that calling this method
+    does not affect the global NumPy random state.
+    """
+    # Create toy model and noisy data
+    model = pints.toy.LogisticModel()
+    times = np.linspace(0, 1000, 1000)
+    noise = 10
+    values = model.simulate([0.015, 500], times)
+    values += np.random.RandomState(seed).normal(0, noise, values.shape)
+    real_parameters = np.array([0.015, 500, noise])
+    real_parameters.setflags(write=False)
+
+    # Create a problem, a prior over both the parameters and the noise
+    # variable, a log likelihood, and an un-normalised log posterior
+    problem = pints.SingleOutputProblem(model, times, values)
+    log_prior = pints.UniformLogPrior(
+        [0.01, 400, noise * 0.1], [0.02, 600, noise * 100])
+    log_likelihood = pints.GaussianLogLikelihood(problem)
+    log_posterior = pints.LogPosterior(log_likelihood, log_prior)
+
+    return LogisticPosterior(
+        problem, log_prior, log_likelihood, log_posterior, real_parameters)
@@ -68,6 +68,20 @@ class TestDiagnostics(unittest.TestCase):
         self.assertRaisesRegex(
             ValueError, 'At least two', pints.effective_sample_size, x[:1])
 
+    def test_effective_sample_sizes(self):
+        # Tests batched ess matches the single parameter version
+
+        np.random.seed(1)
+        x = np.cumsum(np.random.normal(size=(200, 3, 2)), axis=0)
+        y = pints._diagnostics._effective_sample_sizes(x)
+        self.assertEqual(y.shape, (3, 2))
+        for i in range(3):
+            for j in range(2):
+                self.assertAlmostEqual(
+                    y[i, j],
+                    pints._diagnostics.effective_sample_size_single_parameter(
+                        x[:, i, j]))
+
     def test_within(self):
         # Tests within chain variance calculation
 
@@ -6,12 +6,13 @@
 # released under the BSD 3-clause license. See accompanying LICENSE.md for
 # copyright notice and full license details.
 #
+import copy
+import pickle
 import pints
-import pints.toy as toy
 import unittest
 import numpy as np
 
-from shared import StreamCapture
+from shared import StreamCapture, logistic_posterior
 
 
 class TestHaarioACMC(unittest.TestCase):
@@ -23,35 +24,16 @@ class TestHaarioACMC(unittest.TestCase):
     def setUpClass(cls):
         """ Set up problem for tests. """
 
-        # Create toy model
-        cls.model = toy.LogisticModel()
-        cls.real_parameters = [0.015, 500]
-        cls.times = np.linspace(0, 1000, 1000)
-        cls.values = cls.model.simulate(cls.real_parameters, cls.times)
+        # Seed the random number generator used by the samplers
+        np.random.seed(1)
 
-        # Add noise
-        cls.noise = 10
-        cls.values += np.random.normal(0, cls.noise, cls.values.shape)
-        cls.real_parameters.append(cls.noise)
-        cls.real_parameters = np.array(cls.real_parameters)
-
-        # Create an object with links to the model and time series
-        cls.problem = pints.SingleOutputProblem(
-            cls.model, cls.times, cls.values)
-
-        # Create a uniform prior over both the parameters and the new noise
-        # variable
-        cls.log_prior = pints.UniformLogPrior(
-            [0.01, 400, cls.noise * 0.1],
-            [0.02, 600, cls.noise * 100]
-        )
-
-        # Create a log likelihood
-        cls.log_likelihood = pints.GaussianLogLikelihood(cls.problem)
-
-        # Create an un-normalised log-posterior (log-likelihood + log-prior)
-        cls.log_posterior = pints.LogPosterior(
-            cls.log_likelihood, cls.log_prior)
+        # Get shared logistic problem
+        fixture = logistic_posterior()
+        cls.problem = fixture.problem
+        cls.log_prior = fixture.log_prior
+        cls.log_likelihood = fixture.log_likelihood
+        cls.log_posterior = fixture.log_posterior
+        cls.real_parameters = fixture.real_parameters
 
     def test_method(self):
 
@@ -64,8 +46,8 @@ class TestHaarioACMC(unittest.TestCase):
         mcmc.set_initial_phase(True)
 
         # Perform short run
-        rate = []
-        chain = []
+        accepted = np.zeros(100, dtype=bool)
+        chain = np.empty((50, len(x0)))
         for i in range(100):
             x = mcmc.ask()
             fx = self.log_posterior(x)
@@ -73,18 +55,98 @@ class TestHaarioACMC(unittest.TestCase):
             if i == 20:
                 mcmc.set_initial_phase(False)
             if i >= 50:
-                chain.append(y)
-            rate.append(mcmc.acceptance_rate())
+                chain[i - 50] = y
+            accepted[i] = ac
             self.assertTrue(isinstance(ac, bool))
             if ac:
                 self.assertTrue(np.all(x == y))
                 self.assertEqual(fx, fy)
 
-        chain = np.array(chain)
-        rate = np.array(rate)
-        self.assertEqual(chain.shape[0], 50)
-        self.assertEqual(chain.shape[1], len(x0))
-        self.assertEqual(rate.shape[0], 100)
+        # Calculate acceptance rate at each iteration. The initial point is
+        # returned as accepted, but isn't counted as an acceptance.
+        rate = (np.cumsum(accepted) - 1) / np.arange(1, 101)
+        self.assertEqual(rate[-1], mcmc.acceptance_rate())
+
+        self.assertTrue(np.all(np.isfinite(chain)))
+        self.assertTrue(np.all((rate >= 0) & (rate <= 1)))
+
+        # Proposal scaling is kept in sync with log lambda
+        self.assertAlmostEqual(
+            mcmc._proposal_scale, np.exp(0.5 * mcmc._log_lambda))
+
+    def test_proposal_distribution(self):
+        # Test proposals generated from the cached Cholesky factor have the
+        # expected mean and covariance
+        np.random.seed(1)
+        x0 = np.array([1, 2])
+        sigma = np.array([[1, 0.5], [0.5, 2]])
+        mcmc = pints.HaarioACMC(x0, sigma)
+        mcmc.ask()
+        mcmc.tell(0)
+        mcmc._proposal_scale = np.sqrt(2)
+        xs = np.array([mcmc._generate_proposal() for i in range(20000)])
+        self.assertTrue(np.allclose(np.mean(xs, axis=0), x0, atol=0.05))
+        self.assertTrue(np.allclose(np.cov(xs.T), 2 * sigma, atol=0.1))
+
+        # Adapting sigma updates the full (symmetric) matrix and resets the
+        # cached factor
+        mcmc._gamma = 0.5
+        mcmc._mu = np.array([0.5, 1.5])
+        mcmc._adapt_sigma(0)
+        self.assertIsNone(mcmc._sigma_chol)
+        expected = 0.5 * sigma + 0.5 * np.outer([0.5, 0.5], [0.5, 0.5])
+        self.assertTrue(np.allclose(mcmc._sigma, expected))
+        self.assertTrue(np.all(mcmc._sigma == mcmc._sigma.T))
+
+        # The same update is applied to a Fortran-ordered sigma
+        mcmc = pints.HaarioACMC(x0, np.asfortranarray(sigma))
+        mcmc.ask()
+        mcmc.tell(0)
+        mcmc._gamma = 0.5
+        mcmc._mu = np.array([0.5, 1.5])
+        mcmc._adapt_sigma(0)
+        self.assertTrue(np.allclose(mcmc._sigma, expected))
+
+    def test_semi_definite_sigma(self):
+        # Test sampling with a positive semi-definite sigma, for which no
+        # Cholesky factor exists
+        np.random.seed(1)
+        x0 = np.array([1, 2])
+        sigma = np.array([[1, 0], [0, 0]])
+        mcmc = pints.HaarioACMC(x0, sigma)
+        mcmc.ask()
+        mcmc.tell(0)
+        xs = np.array([mcmc._generate_proposal() for i in range(20000)])
+        self.assertTrue(np.all(xs[:, 1] == 2))
+        self.assertTrue(np.allclose(np.mean(xs, axis=0), x0, atol=0.05))
+        self.assertTrue(np.allclose(np.cov(xs.T), sigma, atol=0.05))
+
+    def test_log_u_pool(self):
+        # Test log uniform samples are drawn from a pool that gets refilled
+        mcmc = pints.HaarioACMC(self.real_parameters)
+        us = np.array([mcmc._sample_log_u() for i in range(600)])
+        self.assertTrue(np.all(us <= 0))
+        self.assertEqual(len(np.unique(us)), 600)
+        self.assertEqual(mcmc._log_u_index, 600 - 2 * mcmc._pool_size)
+
+    def test_pickle_and_copy(self):
+        # Test sampler can be pickled and copied mid-run, and that the copies
+        # continue in the same way as the original
+        mcmc = pints.HaarioACMC(self.real_parameters)
+        np.random.seed(1)
+        for i in range(20):
+            mcmc.tell(self.log_posterior(mcmc.ask()))
+
+        copies = [pickle.loads(pickle.dumps(mcmc)), copy.deepcopy(mcmc)]
+        xs = []
+        for sampler in [mcmc] + copies:
+            np.random.seed(2)
+            for i in range(20):
+                x = sampler.ask()
+                sampler.tell(self.log_posterior(x))
+            xs.append(x)
+        self.assertTrue(np.all(xs[0] == xs[1]))
+        self.assertTrue(np.all(xs[0] == xs[2]))
 
     def test_hyperparameters(self):
         # Hyperparameters unchanged from base class
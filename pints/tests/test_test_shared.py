@@ -10,7 +10,9 @@ import os
 import sys
 import unittest
 
-from shared import StreamCapture, TemporaryDirectory
+import numpy as np
+
+from shared import StreamCapture, TemporaryDirectory, logistic_posterior
 
 
 class TestSharedTestModule(unittest.TestCase):
@@ -18,6 +20,22 @@ class TestSharedTestModule(unittest.TestCase):
     Tests the test.shared methods.
     """
 
+    def test_logistic_posterior(self):
+        # Tests the cached logistic posterior fixture.
+
+        # Doesn't change the global random state
+        state = np.random.get_state()[1].copy()
+        f = logistic_posterior()
+        self.assertTrue(np.all(np.random.get_state()[1] == state))
+
+        # Returns cached objects
+        self.assertIs(logistic_posterior(), f)
+        self.assertIsNot(logistic_posterior(2), f)
+
+        # Returns a working log posterior
+        self.assertEqual(f.log_posterior.n_parameters(), 3)
+        self.assertTrue(np.isfinite(f.log_posterior(f.real_parameters)))
+
     def test_stream_capture(self):
         # Tests the StreamCapture class.
 
@@ -95,6 +95,14 @@ class TestGaussianLogPDF(unittest.TestCase):
         self.assertEqual(s32, log_pdf3.distance(samples2))
         self.assertEqual(s33, log_pdf3.distance(samples3))
 
+        # Test 1d case against a direct calculation
+        f = pints.toy.GaussianLogPDF([1], [2])
+        x = np.random.normal(1.2, 1.5, size=(1000, 1))
+        m, v = np.mean(x), np.var(x, ddof=1)
+        self.assertAlmostEqual(
+            f.kl_divergence(x),
+            0.5 * (v / 2 + (1 - m)**2 / 2 + np.log(2 / v) - 1))
+
         # Test sample() errors
         self.assertRaises(ValueError, log_pdf1.sample, -1)
 
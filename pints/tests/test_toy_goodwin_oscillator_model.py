@@ -17,6 +17,16 @@ class TestGoodwinOscillatorModel(unittest.TestCase):
     Tests if the goodwin oscillator (toy) model runs.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        # Simulations shared by the value and sensitivity tests
+        cls.model = pints.toy.GoodwinOscillatorModel()
+        cls.parameters = [3, 2.5, 0.15, 0.1, 0.12]
+        cls.times = np.linspace(0, 10, 101)
+        cls.values = cls.model.simulate(cls.parameters, cls.times)
+        cls.values1, cls.dvals = cls.model.simulateS1(
+            cls.parameters, cls.times)
+
     def test_run(self):
         model = pints.toy.GoodwinOscillatorModel()
         self.assertEqual(model.n_parameters(), 5)
@@ -28,10 +38,7 @@ class TestGoodwinOscillatorModel(unittest.TestCase):
 
     def test_values(self):
         # value-based tests of Goodwin-oscillator
-        model = pints.toy.GoodwinOscillatorModel()
-        parameters = [3, 2.5, 0.15, 0.1, 0.12]
-        times = np.linspace(0, 10, 101)
-        values = model.simulate(parameters, times)
+        values = self.values
         self.assertEqual(values[0, 0], 0.0054)
         self.assertEqual(values[0, 1], 0.053)
         self.assertEqual(values[0, 2], 1.93)
@@ -42,24 +49,20 @@ class TestGoodwinOscillatorModel(unittest.TestCase):
     def test_sensitivity(self):
         # tests construction of matrices for sensitivity calculation and
         # compares sensitivities vs standards
-        model = pints.toy.GoodwinOscillatorModel()
-        parameters = [3, 2.5, 0.15, 0.1, 0.12]
+        model = self.model
+        parameters = self.parameters
         k2, k3, m1, m2, m3 = parameters
-        time = np.linspace(0, 10, 101)
+        time = self.times
         state = [0.01, 0.1, 2]
         x, y, z = state
         ret = model.jacobian(state, 0.0, parameters)
-        self.assertEqual(ret[0, 0], -m1)
-        self.assertEqual(ret[0, 1], 0)
-        self.assertEqual(ret[0, 2], -10 * z**9 / ((1 + z**10)**2))
-        self.assertEqual(ret[1, 0], k2)
-        self.assertEqual(ret[1, 1], -m2)
-        self.assertEqual(ret[1, 2], 0)
-        self.assertEqual(ret[2, 0], 0)
-        self.assertEqual(ret[2, 1], k3)
-        self.assertEqual(ret[2, 2], -m3)
-        values = model.simulate(parameters, time)
-        values1, dvals = model.simulateS1(parameters, time)
+        expected = np.array([
+            [-m1, 0, -10 * z**9 / ((1 + z**10)**2)],
+            [k2, -m2, 0],
+            [0, k3, -m3],
+        ])
+        np.testing.assert_array_equal(ret, expected)
+        values, values1, dvals = self.values, self.values1, self.dvals
         self.assertTrue(np.array_equal(values.shape, values1.shape))
         self.assertTrue(np.array_equal(
             dvals.shape,
@@ -67,10 +70,7 @@ class TestGoodwinOscillatorModel(unittest.TestCase):
         # note -- haven't coded this up separately to check but compare against
         # current output in case of future changes
         self.assertTrue(np.abs(-2.20655371e-05 - dvals[10, 0, 0]) < 10**(-5))
-        for i in range(len(time)):
-            for j in range(3):
-                self.assertTrue(
-                    np.abs(values[i, j] - values1[i, j]) < 10**(-3))
+        np.testing.assert_allclose(values1, values, rtol=0, atol=1e-3)
 
         model = pints.toy.GoodwinOscillatorModel()
         parameters = model.suggested_parameters()
@@ -34,6 +34,12 @@ class TestParabolicError(unittest.TestCase):
         self.assertEqual(f([1, 1, 1]), 0)
         self.assertTrue(f([1.1, 1.1, 1.1]) > 0)
 
+        # Optimum can't be modified
+        x = f.optimum()
+        self.assertRaises(ValueError, x.__setitem__, 0, 2)
+        self.assertRaises(ValueError, x.setflags, write=True)
+        self.assertEqual(list(f.optimum()), [1, 1, 1])
+
         # Test sensitivities
         x = [1, 1, 1]
         fx, dfx = f.evaluateS1(x)
@@ -10,6 +10,7 @@ import pints
 import pints.toy
 import unittest
 import numpy as np
+import scipy.stats
 
 
 class TestTwistedGaussianLogPDF(unittest.TestCase):
@@ -24,6 +25,13 @@ class TestTwistedGaussianLogPDF(unittest.TestCase):
         self.assertEqual(f.n_parameters(), 10)
         self.assertTrue(np.isscalar(f(np.zeros(10))))
 
+        # Test values against the underlying multivariate normal
+        f = pints.toy.TwistedGaussianLogPDF(3, 0.05, 80)
+        y = [1 / np.sqrt(80), 2 + 0.05 * (1 - 80), 3]
+        phi = scipy.stats.multivariate_normal(
+            np.zeros(3), np.diag([80, 1, 1]))
+        self.assertAlmostEqual(f([1, 2, 3]), phi.logpdf(y))
+
         # Test errors
         self.assertRaises(ValueError, pints.toy.TwistedGaussianLogPDF, 1)
         self.assertRaises(ValueError, pints.toy.TwistedGaussianLogPDF, b=-1)
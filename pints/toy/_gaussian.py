@@ -57,6 +57,7 @@ class GaussianLogPDF(ToyLogPDF):
         # Create scipy distribution
         self._phi = scipy.stats.multivariate_normal(self._mean, self._sigma)
         self._sigma_inv = np.linalg.inv(self._sigma)
+        self._sigma_logdet = np.linalg.slogdet(self._sigma)[1]
 
     def __call__(self, x):
         y = vector(x).reshape(self._n_parameters)
@@ -107,16 +108,17 @@ class GaussianLogPDF(ToyLogPDF):
         #       )
         #
         # using s1 = real sigma, as this needs to be inverted and the real one
-        # is more likely to be invertible than the sample one
+        # is more likely to be invertible than the sample one. The inverse and
+        # log determinant of s1 are calculated once, on construction.
         m0 = np.mean(samples, axis=0)
         m1 = self._mean
-        s0 = np.cov(samples.T)
-        s1 = self._sigma
-        cov_inv = np.linalg.inv(s1)
+        s0 = np.atleast_2d(np.cov(samples.T))
+        cov_inv = self._sigma_inv
 
-        dkl1 = np.trace(cov_inv.dot(s0))
+        # Both matrices are symmetric, so trace(A B) = sum(A * B)
+        dkl1 = np.sum(cov_inv * s0)
         dkl2 = np.dot((m1 - m0).T, cov_inv).dot(m1 - m0)
-        dkl3 = np.log(np.linalg.det(s1) / np.linalg.det(s0))
+        dkl3 = self._sigma_logdet - np.linalg.slogdet(s0)[1]
         return 0.5 * (dkl1 + dkl2 + dkl3 - self._n_parameters)
 
     def n_parameters(self):
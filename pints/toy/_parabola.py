@@ -6,7 +6,6 @@
 # copyright notice and full license details.
 #
 import pints
-import numpy as np
 
 
 class ParabolicError(pints.ErrorMeasure):
@@ -29,13 +28,13 @@ class ParabolicError(pints.ErrorMeasure):
         self._n = len(self._c)
 
     def __call__(self, x):
-        y = pints.vector(x).reshape(self._n)
-        return np.sum((self._c - y)**2)
+        d = self._c - pints.vector(x).reshape(self._n)
+        return d.dot(d)
 
     def evaluateS1(self, x):
         """ See :meth:`pints.ErrorMeasure.evaluateS1()`. """
         x = pints.vector(x) - self._c
-        return np.sum(x**2), 2 * x
+        return x.dot(x), 2 * x
 
     def n_parameters(self):
         """ See :meth:`pints.ErrorMeasure.n_parameters()`. """
@@ -44,5 +43,8 @@ class ParabolicError(pints.ErrorMeasure):
     def optimum(self):
         """
         Returns the global optimum for this function.
+
+        The returned array is a read-only view: use ``optimum().copy()`` to
+        obtain a modifiable copy.
         """
-        return np.array(self._c, copy=True)
+        return self._c.view()